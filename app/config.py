@@ -20,7 +20,17 @@ class Settings:
         "BUNDESBANK_SAMPLE_CSV",
         "data/sample/BBIN1.M.D0.ECB.ECBMIN.EUR.ME.sample.csv",
     )
-    request_timeout_s: int = int(os.getenv("BUNDESBANK_TIMEOUT", "30"))
+    request_timeout_s: int = int(os.getenv("BUNDESBANK_TIMEOUT", "10"))
+    fetch_deadline_s: float = float(os.getenv("BUNDESBANK_FETCH_DEADLINE", "20"))
+    hedge_delay_s: float = float(os.getenv("BUNDESBANK_HEDGE_DELAY", "2"))
+    retry_attempts: int = int(os.getenv("BUNDESBANK_RETRY_ATTEMPTS", "2"))
+    retry_backoff_s: float = float(os.getenv("BUNDESBANK_RETRY_BACKOFF", "0.5"))
+    breaker_failure_threshold: int = int(os.getenv("BUNDESBANK_BREAKER_THRESHOLD", "3"))
+    breaker_cooldown_s: float = float(os.getenv("BUNDESBANK_BREAKER_COOLDOWN", "300"))
+    fit_max_obs: int = int(os.getenv("FORECAST_FIT_MAX_OBS", "1000"))
+    selection_max_obs: int = int(os.getenv("FORECAST_SELECTION_MAX_OBS", "500"))
+    aggregate_freq: str = os.getenv("FORECAST_AGGREGATE_FREQ", "").upper()
+    aggregate_how: str = os.getenv("FORECAST_AGGREGATE_HOW", "mean").lower()
 
 
 SETTINGS = Settings()
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Optional
 
@@ -39,35 +43,195 @@ def _read_local_file(path: str) -> str:
     return Path(path).read_text(encoding="utf-8")
 
 
+class _CircuitBreaker:
+    """Per-endpoint failure counter that skips a source during its cool-down.
+
+    Failures are counted once per exhausted endpoint fetch. After the
+    cool-down the circuit is half-open: a single probe is admitted and its
+    result either closes the circuit or re-opens it for another cool-down.
+    """
+
+    def __init__(self, failure_threshold: int, cooldown_s: float) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_s = cooldown_s
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        self._probing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def allow(self, name: str) -> bool:
+        with self._lock:
+            opened_at = self._opened_at.get(name)
+            if opened_at is None:
+                return True
+            if name in self._probing or time.monotonic() - opened_at < self.cooldown_s:
+                return False
+            self._probing.add(name)
+            return True
+
+    def record_success(self, name: str) -> None:
+        with self._lock:
+            self._failures.pop(name, None)
+            self._opened_at.pop(name, None)
+            self._probing.discard(name)
+
+    def record_failure(self, name: str) -> None:
+        with self._lock:
+            failures = self._failures.get(name, 0) + 1
+            self._failures[name] = failures
+            self._probing.discard(name)
+            if failures >= self.failure_threshold or name in self._opened_at:
+                self._opened_at[name] = time.monotonic()
+
+    def release(self, name: str) -> None:
+        """Free a half-open probe slot without recording a result."""
+        with self._lock:
+            self._probing.discard(name)
+
+
+_BREAKER = _CircuitBreaker(SETTINGS.breaker_failure_threshold, SETTINGS.breaker_cooldown_s)
+
+# Shared, fixed-size pool so abandoned in-flight requests cannot pile up threads.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="bundesbank-fetch")
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, (requests.Timeout, requests.ConnectionError)):
+        return True
+    if isinstance(exc, requests.HTTPError) and exc.response is not None:
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return False
+
+
+def _fetch_endpoint(name: str, url: str, deadline: float, decided: threading.Event) -> str:
+    """GET `url` with jittered exponential backoff, bounded by `deadline`.
+
+    Only timeouts, connection errors and 5xx/429 responses are retried and
+    counted by the circuit breaker. Stops early once `decided` is set.
+    """
+    last_error: Optional[Exception] = None
+    attempts = max(1, SETTINGS.retry_attempts)
+
+    for attempt in range(attempts):
+        remaining = deadline - time.monotonic()
+        if decided.is_set() or remaining <= 0:
+            break
+        try:
+            resp = requests.get(url, timeout=min(SETTINGS.request_timeout_s, remaining))
+            resp.raise_for_status()
+            if not resp.text.strip():
+                raise ValueError(f"Empty response from {name} endpoint")
+        except Exception as exc:  # pragma: no cover - network-dependent
+            last_error = exc
+            if not _is_transient(exc):
+                break
+        else:
+            _BREAKER.record_success(name)
+            if not decided.is_set():
+                _maybe_cache(resp.text, f"{SETTINGS.series_ts_id}.{name}.csv")
+            return resp.text
+
+        if attempt + 1 < attempts:
+            backoff = SETTINGS.retry_backoff_s * (2**attempt)
+            delay = random.uniform(0, backoff)
+            if time.monotonic() + delay >= deadline or decided.wait(delay):
+                break
+
+    # A finished transient failure always counts, even if the race was decided
+    # meanwhile; only a fetch that never completed an attempt gives back its slot.
+    if last_error is not None and _is_transient(last_error):
+        _BREAKER.record_failure(name)
+    else:
+        _BREAKER.release(name)
+
+    if last_error is None:
+        raise TimeoutError(f"Deadline exceeded for {name} endpoint")
+    raise last_error
+
+
+def _fetch_hedged(deadline: float) -> str:
+    """Race the REST API against a delayed hedge on the direct download.
+
+    The direct download is only started once the primary has failed or has
+    not answered within `hedge_delay_s`; the first valid response wins and
+    the losing request stops retrying. Endpoints with an open circuit are
+    skipped; if none is allowed the fetch fails without sending a request.
+    """
+    queued = [("api", _build_api_url()), ("direct", _build_direct_csv_url())]
+    decided = threading.Event()
+    pending: dict[Future, str] = {}
+    last_error: Optional[Exception] = None
+    circuit_error: Optional[Exception] = None
+
+    def start_next() -> None:
+        nonlocal circuit_error
+        while queued:
+            name, url = queued.pop(0)
+            if _BREAKER.allow(name):
+                pending[_EXECUTOR.submit(_fetch_endpoint, name, url, deadline, decided)] = name
+                return
+            circuit_error = circuit_error or RuntimeError(f"Circuit open for {name} endpoint")
+
+    try:
+        start_next()
+        if not pending:
+            raise circuit_error or RuntimeError("No Bundesbank endpoint available")
+        hedge_delay = min(SETTINGS.hedge_delay_s, max(0.0, deadline - time.monotonic()))
+        done, _ = wait(pending, timeout=hedge_delay)
+
+        while True:
+            for future in done:
+                pending.pop(future, None)
+                try:
+                    text = future.result()
+                except Exception as exc:  # pragma: no cover - network-dependent
+                    last_error = last_error or exc
+                else:
+                    decided.set()
+                    return text
+
+            if queued:
+                start_next()
+
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+    finally:
+        # Stop the losing request from retrying; an in-flight attempt still
+        # runs until its own timeout, so do not block on it here.
+        decided.set()
+        for future, name in pending.items():
+            if future.cancel():
+                _BREAKER.release(name)
+
+    if last_error is None:
+        last_error = circuit_error or TimeoutError("Deadline exceeded while fetching Bundesbank CSV")
+    raise last_error
+
+
 def fetch_csv_text() -> str:
     """Fetch CSV text from Bundesbank REST API or fallback sources.
 
     Priority:
     1) Local CSV if BUNDESBANK_LOCAL_CSV is set
-    2) Bundesbank REST API (sdmx_csv)
-    3) Direct CSV download (statistic-rmi)
-    4) Sample CSV (if ALLOW_SAMPLE_FALLBACK=true)
+    2) Bundesbank REST API (sdmx_csv), hedged after BUNDESBANK_HEDGE_DELAY
+       seconds with the direct CSV download (statistic-rmi); the first valid
+       response wins, all within BUNDESBANK_FETCH_DEADLINE seconds
+    3) Sample CSV (if ALLOW_SAMPLE_FALLBACK=true)
+
+    Endpoints that keep failing are skipped for BUNDESBANK_BREAKER_COOLDOWN
+    seconds by a per-endpoint circuit breaker.
     """
     if SETTINGS.local_csv_path:
         return _read_local_file(SETTINGS.local_csv_path)
 
     last_error: Optional[Exception] = None
 
-    api_url = _build_api_url()
-    try:
-        resp = requests.get(api_url, timeout=SETTINGS.request_timeout_s)
-        resp.raise_for_status()
-        _maybe_cache(resp.text, f"{SETTINGS.series_ts_id}.api.csv")
-        return resp.text
-    except Exception as exc:  # pragma: no cover - network-dependent
-        last_error = exc
-
-    direct_url = _build_direct_csv_url()
+    deadline = time.monotonic() + SETTINGS.fetch_deadline_s
     try:
-        resp = requests.get(direct_url, timeout=SETTINGS.request_timeout_s)
-        resp.raise_for_status()
-        _maybe_cache(resp.text, f"{SETTINGS.series_ts_id}.direct.csv")
-        return resp.text
+        return _fetch_hedged(deadline)
     except Exception as exc:  # pragma: no cover - network-dependent
         last_error = exc
 
@@ -92,13 +92,34 @@ def select_arima_order(
     return best_order, best_rmse
 
 
-def fit_and_forecast(series: pd.Series, horizon: int = 12) -> ForecastResult:
+def _trailing_window(series: pd.Series, max_obs: int | None) -> pd.Series:
+    if max_obs is None or max_obs <= 0 or len(series) <= max_obs:
+        return series
+    return series.iloc[-max_obs:].reset_index(drop=True)
+
+
+def fit_and_forecast(
+    series: pd.Series,
+    horizon: int = 12,
+    fit_max_obs: int | None = None,
+    selection_max_obs: int | None = None,
+) -> ForecastResult:
+    """Select and fit an ARIMA model on trailing windows of `series`.
+
+    `fit_max_obs` caps the observations used for the final fit and
+    `selection_max_obs` those used for differencing and CV order selection,
+    so cost stays constant as history grows. `None` or `<= 0` means no limit.
+    """
     series = series.dropna()
-    d = determine_integration_order(series)
-    order, cv_rmse = select_arima_order(series, d)
+    history_nobs = len(series)
+    fit_series = _trailing_window(series, fit_max_obs)
+    selection_series = _trailing_window(fit_series, selection_max_obs)
+
+    d = determine_integration_order(selection_series)
+    order, cv_rmse = select_arima_order(selection_series, d)
 
     model = ARIMA(
-        series,
+        fit_series,
         order=order,
         enforce_stationarity=False,
         enforce_invertibility=False,
@@ -116,6 +137,10 @@ def fit_and_forecast(series: pd.Series, horizon: int = 12) -> ForecastResult:
         "llf": float(model.llf) if model.llf is not None else None,
         "nobs": int(model.nobs) if model.nobs is not None else None,
         "cv_rmse": float(cv_rmse) if cv_rmse is not None else None,
+        "history_nobs": int(history_nobs),
+        "selection_nobs": int(len(selection_series)),
+        "fit_max_obs": int(fit_max_obs) if fit_max_obs and fit_max_obs > 0 else None,
+        "selection_max_obs": int(selection_max_obs) if selection_max_obs and selection_max_obs > 0 else None,
         "horizon": int(horizon),
     }
 
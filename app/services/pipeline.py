@@ -7,7 +7,7 @@ from pathlib import Path
 import pandas as pd
 
 from app.services.bundesbank_client import fetch_csv_text
-from app.services.transformer import load_time_series
+from app.services.transformer import aggregate_time_series, load_time_series
 from app.services.forecast import fit_and_forecast
 from app.config import SETTINGS
 
@@ -38,11 +38,23 @@ def _write_intermediate(
 def build_forecast_table(horizon: int = 12) -> pd.DataFrame:
     csv_text = fetch_csv_text()
     ts_df = load_time_series(csv_text)
+    source_nobs = len(ts_df)
+    aggregation = None
+    if SETTINGS.aggregate_freq:
+        source_freq = ts_df["period"].dt.freq
+        ts_df = aggregate_time_series(ts_df, SETTINGS.aggregate_freq, SETTINGS.aggregate_how)
+        if ts_df["period"].dt.freq != source_freq:
+            aggregation = f"{SETTINGS.aggregate_freq}:{SETTINGS.aggregate_how}"
 
     if ts_df.empty:
         raise ValueError("No time series data available after cleaning")
 
-    forecast_result = fit_and_forecast(ts_df["value"], horizon=horizon)
+    forecast_result = fit_and_forecast(
+        ts_df["value"],
+        horizon=horizon,
+        fit_max_obs=SETTINGS.fit_max_obs,
+        selection_max_obs=SETTINGS.selection_max_obs,
+    )
 
     freq = ts_df["period"].dt.freq
     if freq is None:
@@ -80,6 +92,8 @@ def build_forecast_table(horizon: int = 12) -> pd.DataFrame:
         f"?format={SETTINGS.api_format}&detail={SETTINGS.api_detail}"
     )
     metadata["generated_at_utc"] = datetime.now(timezone.utc).isoformat()
+    metadata["source_nobs"] = int(source_nobs)
+    metadata["aggregation"] = aggregation
 
     output["meta_order"] = ",".join(str(x) for x in metadata.get("order", []))
     output["meta_aic"] = metadata.get("aic")
@@ -91,6 +105,9 @@ def build_forecast_table(horizon: int = 12) -> pd.DataFrame:
     output["meta_source_ts_id"] = metadata.get("source_ts_id")
     output["meta_source_url"] = metadata.get("source_url")
     output["meta_generated_at_utc"] = metadata.get("generated_at_utc")
+    output["meta_selection_nobs"] = metadata.get("selection_nobs")
+    output["meta_source_nobs"] = metadata.get("source_nobs")
+    output["meta_aggregation"] = metadata.get("aggregation")
 
     base_cols = ["timestamp", "value", "type", "lower", "upper"]
     meta_cols = [
@@ -104,6 +121,9 @@ def build_forecast_table(horizon: int = 12) -> pd.DataFrame:
         "meta_source_ts_id",
         "meta_source_url",
         "meta_generated_at_utc",
+        "meta_selection_nobs",
+        "meta_source_nobs",
+        "meta_aggregation",
     ]
     output = output[base_cols + meta_cols]
     _write_intermediate(
@@ -11,6 +11,23 @@ import pandas as pd
 _TIME_TOKENS = ("time", "period", "zeit", "date", "datum")
 _VALUE_TOKENS = ("value", "wert", "obs_value", "observation")
 
+# Target frequency -> (DuckDB date_trunc unit, pandas period freq, granularity rank)
+_AGGREGATE_FREQS = {
+    "M": ("month", "M", 2),
+    "Q": ("quarter", "Q", 3),
+    "A": ("year", "Y", 4),
+    "Y": ("year", "Y", 4),
+}
+_EDGE_TOLERANCE = pd.Timedelta(days=4)
+_FREQ_RANKS = {"D": 0, "B": 0, "W": 1, "M": 2, "Q": 3, "A": 4, "Y": 4}
+_AGGREGATE_EXPRS = {
+    "mean": "AVG(value)",
+    "last": "ARG_MAX(value, ts)",
+    "first": "ARG_MIN(value, ts)",
+    "min": "MIN(value)",
+    "max": "MAX(value)",
+}
+
 
 def _find_header_index(lines: list[str]) -> int:
     for idx, line in enumerate(lines[:80]):
@@ -127,3 +144,63 @@ def load_time_series(csv_text: str) -> pd.DataFrame:
 
     cleaned = cleaned.sort_values("period").drop_duplicates("period")
     return cleaned[["period", "value"]].reset_index(drop=True)
+
+
+def _is_partial_bucket(bucket: pd.Period, edge: pd.Period, trailing: bool) -> bool:
+    """Whether the observed `edge` stops short of the `bucket` boundary.
+
+    Gaps up to `_EDGE_TOLERANCE` (weekends, public holidays) are accepted,
+    so only buckets missing a substantial stretch of data count as partial.
+    """
+    if trailing:
+        return bucket.end_time - edge.end_time > _EDGE_TOLERANCE
+    return edge.start_time - bucket.start_time > _EDGE_TOLERANCE
+
+
+def aggregate_time_series(ts_df: pd.DataFrame, freq: str, how: str = "mean") -> pd.DataFrame:
+    """Aggregate a clean `period`/`value` frame to a coarser frequency in DuckDB.
+
+    `freq` is one of M, Q, A (or Y); `how` is one of mean, last, first, min, max.
+    Frames already at (or coarser than) the target frequency are returned as-is.
+    Incomplete first and last buckets are dropped so a partially observed
+    period is never reported (or forecast from) as a full one.
+    """
+    freq = freq.upper()
+    how = how.lower()
+    if freq not in _AGGREGATE_FREQS:
+        raise ValueError(f"Unsupported aggregation frequency: {freq}")
+    if how not in _AGGREGATE_EXPRS:
+        raise ValueError(f"Unsupported aggregation method: {how}")
+    if ts_df.empty:
+        return ts_df
+
+    unit, period_freq, target_rank = _AGGREGATE_FREQS[freq]
+    source_freq = ts_df["period"].dt.freq.name
+    if _FREQ_RANKS.get(source_freq[0], 0) >= target_rank:
+        return ts_df
+
+    frame = pd.DataFrame(
+        {"ts": ts_df["period"].dt.start_time, "value": ts_df["value"].astype(float)}
+    )
+    con = duckdb.connect(":memory:")
+    con.register("series", frame)
+    query = f"""
+        SELECT
+            DATE_TRUNC('{unit}', ts) AS bucket,
+            {_AGGREGATE_EXPRS[how]} AS value
+        FROM series
+        GROUP BY bucket
+        ORDER BY bucket
+    """
+    aggregated = con.execute(query).df()
+    con.close()
+
+    aggregated["period"] = pd.to_datetime(aggregated["bucket"]).dt.to_period(period_freq)
+    aggregated["value"] = aggregated["value"].astype(float)
+
+    first, last = ts_df["period"].iloc[0], ts_df["period"].iloc[-1]
+    if _is_partial_bucket(aggregated["period"].iloc[-1], last, trailing=True):
+        aggregated = aggregated.iloc[:-1]
+    if not aggregated.empty and _is_partial_bucket(aggregated["period"].iloc[0], first, trailing=False):
+        aggregated = aggregated.iloc[1:]
+    return aggregated[["period", "value"]].reset_index(drop=True)
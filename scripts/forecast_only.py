@@ -3,8 +3,9 @@ from __future__ import annotations
 import argparse
 
 from app.services.bundesbank_client import fetch_csv_text
-from app.services.transformer import load_time_series
+from app.services.transformer import aggregate_time_series, load_time_series
 from app.services.forecast import fit_and_forecast
+from app.config import SETTINGS
 
 
 def main() -> None:
@@ -15,7 +16,14 @@ def main() -> None:
 
     csv_text = fetch_csv_text()
     ts_df = load_time_series(csv_text)
-    result = fit_and_forecast(ts_df["value"], horizon=args.horizon)
+    if SETTINGS.aggregate_freq:
+        ts_df = aggregate_time_series(ts_df, SETTINGS.aggregate_freq, SETTINGS.aggregate_how)
+    result = fit_and_forecast(
+        ts_df["value"],
+        horizon=args.horizon,
+        fit_max_obs=SETTINGS.fit_max_obs,
+        selection_max_obs=SETTINGS.selection_max_obs,
+    )
 
     forecast_df = result.forecast.reset_index(drop=True).to_frame(name="forecast")
     csv_out = forecast_df.to_csv(index=False)